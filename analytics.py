@@ -0,0 +1,258 @@
+"""Columnar analytics over every stored subject score.
+
+Kept out of main.py, which imports Streamlit and opens the database on
+import, so the statistics workers started by ProcessPoolExecutor only need
+NumPy and pandas.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Subject rows handed to each worker
+ANALYTICS_CHUNK_SIZE = 250_000
+
+# Smaller snapshots are aggregated in-process. Only the per-chunk bincounts run in
+# the workers (about 0.05 s per million rows), while building group codes and
+# pickling chunks to the workers stay serial (about 0.06 s per million rows), and
+# a pool costs about 0.1 s to start (0.7 s the first time). Below about 20 million
+# rows the pool saves less than it costs, however many cores there are
+PARALLEL_MIN_ROWS = 20_000_000
+
+# Workers come from a fork server instead of forking the caller, which may be the
+# multi-threaded Streamlit server. The server loads the main module, NumPy and
+# pandas once, so each worker starts without importing them again
+WORKER_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Columns statistics can be grouped by
+GROUP_COLUMNS = ("subject", "class_section", "term")
+
+SUBJECT_ROWS_QUERY = '''SELECT r.id, r.class_section, r.term, s.subject_name, s.score
+                        FROM reports r JOIN subjects s ON s.report_id = r.id'''
+
+SNAPSHOT_COLUMNS = ["report_id", "class_section", "term", "subject", "score"]
+
+def subject_frame(rows):
+    """Columnar frame of (report_id, class_section, term, subject, score) rows"""
+    frame = pd.DataFrame(rows, columns=SNAPSHOT_COLUMNS)
+    for column in SNAPSHOT_COLUMNS[:-1]:
+        frame[column] = frame[column].astype("category")
+    frame["score"] = frame["score"].astype(np.float32)
+    return frame
+
+def concat_frames(frames):
+    """Concatenate subject frames, keeping every key column categorical"""
+    frames = [frame for frame in frames if len(frame)] or frames[:1]
+    return pd.DataFrame({
+        column: (
+            pd.api.types.union_categoricals(
+                [frame[column] for frame in frames], ignore_order=True
+            )
+            if column != "score"
+            else np.concatenate([frame[column].to_numpy() for frame in frames])
+        )
+        for column in SNAPSHOT_COLUMNS
+    })
+
+class ReportSnapshot:
+    """In-memory columnar copy of every subject score with its report's class and term.
+
+    Keys are pandas categoricals and scores a float32 array. seq is the
+    change cursor (see main.SQLiteStore.change_cursor) of the report_changes
+    entries the snapshot reflects; refresh() loads only the reports changed
+    since then. version goes up whenever the data does, so results can be
+    cached against it.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.seq = None
+        self.version = 0
+        self.frame = subject_frame([])
+
+    def refresh(self, conn, store):
+        """Bring the snapshot up to date; returns the number of reports reloaded or dropped.
+
+        store provides change_cursor() and changes_after() for conn's backend.
+        """
+        with self._lock:
+            c = conn.cursor()
+            try:
+                # Taken first, so no change can slip between it and the reads below
+                seq = store.change_cursor(c)
+                if self.seq is None:
+                    c.execute(SUBJECT_ROWS_QUERY)
+                    self.frame = subject_frame(c.fetchall())
+                    self.seq = seq
+                    self.version += 1
+                    return self.frame["report_id"].nunique()
+
+                where, params = store.changes_after(self.seq)
+                c.execute(f'''SELECT report_id, operation FROM report_changes
+                              WHERE {where} ORDER BY seq''', params)
+                latest = {}
+                for report_id, operation in c:
+                    latest[report_id] = operation
+                if not latest:
+                    self.seq = seq
+                    return 0
+
+                reloaded = [
+                    report_id for report_id, operation in latest.items()
+                    if operation not in ("delete", "archive")
+                ]
+                rows = []
+                for start in range(0, len(reloaded), 500):
+                    chunk = reloaded[start:start + 500]
+                    placeholders = ", ".join("?" * len(chunk))
+                    c.execute(SUBJECT_ROWS_QUERY + f''' WHERE r.id IN ({placeholders})''', chunk)
+                    rows.extend(c.fetchall())
+            finally:
+                c.close()
+
+            kept = self.frame[~self.frame["report_id"].isin(list(latest))]
+            frame = concat_frames([kept, subject_frame(rows)])
+            # Deleted students, classes and terms would otherwise stay as categories
+            for column in SNAPSHOT_COLUMNS[:-1]:
+                frame[column] = frame[column].cat.remove_unused_categories()
+            self.frame = frame
+            self.seq = seq
+            self.version += 1
+            return len(latest)
+
+    def terms(self):
+        """Terms with at least one score, in name order"""
+        with self._lock:
+            return sorted(self.frame["term"].dropna().unique())
+
+    def group_codes(self, by):
+        """Group code per subject row for the columns in by, and the group index.
+
+        Only key combinations that occur are numbered, in sorted order. Rows
+        with a missing key (e.g. reports without a term) get code -1.
+        """
+        with self._lock:
+            frame = self.frame
+        columns = [frame[column].cat for column in by]
+        codes = [column.codes.to_numpy() for column in columns]
+        shape = tuple(max(len(column.categories), 1) for column in columns)
+        missing = np.zeros(len(frame), dtype=bool)
+        for key_codes in codes:
+            missing |= key_codes < 0
+        combined = np.ravel_multi_index([np.maximum(key_codes, 0) for key_codes in codes], shape)
+
+        group_codes = np.full(len(frame), -1, dtype=np.intp)
+        group_codes[~missing], present = pd.factorize(combined[~missing], sort=True)
+        index = pd.MultiIndex.from_arrays(
+            [column.categories.take(key_codes)
+             for column, key_codes in zip(columns, np.unravel_index(present, shape))],
+            names=list(by),
+        )
+        return group_codes, frame["score"].to_numpy(), index
+
+def partial_stats(group_codes, scores, n_groups):
+    """Count, sum, sum of squares, min and max of scores per group code (>= 0)"""
+    present = group_codes >= 0
+    group_codes, scores = group_codes[present], scores[present].astype(np.float64)
+    lowest = np.full(n_groups, np.inf)
+    highest = np.full(n_groups, -np.inf)
+    np.minimum.at(lowest, group_codes, scores)
+    np.maximum.at(highest, group_codes, scores)
+    return np.stack([
+        np.bincount(group_codes, minlength=n_groups).astype(np.float64),
+        np.bincount(group_codes, weights=scores, minlength=n_groups),
+        np.bincount(group_codes, weights=scores * scores, minlength=n_groups),
+        lowest,
+        highest,
+    ])
+
+def worker_context():
+    """Multiprocessing context the statistics workers are started from"""
+    context = multiprocessing.get_context(WORKER_START_METHOD)
+    if WORKER_START_METHOD == "forkserver":
+        context.set_forkserver_preload(["__main__", "numpy", "pandas", __name__])
+    return context
+
+def group_stats(snapshot, by=("subject",), workers=None, chunk_size=ANALYTICS_CHUNK_SIZE):
+    """Score statistics per group of subject rows.
+
+    Rows are aggregated in chunks, on a process pool of workers (default:
+    every core) once the snapshot reaches PARALLEL_MIN_ROWS. Returns a
+    DataFrame indexed by the by columns with count, mean, std, min and max.
+    """
+    by = tuple(by)
+    unknown = set(by) - set(GROUP_COLUMNS)
+    if unknown:
+        raise ValueError(f"cannot group by {', '.join(sorted(unknown))}")
+
+    codes, scores, index = snapshot.group_codes(by)
+    n_groups = len(index)
+    starts = range(0, len(codes), chunk_size)
+    chunks = [(codes[start:start + chunk_size], scores[start:start + chunk_size], n_groups)
+              for start in starts]
+    if len(codes) >= PARALLEL_MIN_ROWS and workers != 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 mp_context=worker_context()) as executor:
+            partials = list(executor.map(partial_stats, *zip(*chunks)))
+    else:
+        partials = [partial_stats(*chunk) for chunk in chunks]
+
+    if partials:
+        stacked = np.stack(partials)
+        count, total, squares = stacked[:, :3].sum(axis=0)
+        lowest, highest = stacked[:, 3].min(axis=0), stacked[:, 4].max(axis=0)
+    else:
+        count = total = squares = np.zeros(n_groups)
+        lowest, highest = np.full(n_groups, np.inf), np.full(n_groups, -np.inf)
+
+    present = count > 0
+    mean = np.divide(total, count, out=np.zeros(n_groups), where=present)
+    variance = np.divide(squares, count, out=np.zeros(n_groups), where=present) - mean ** 2
+    stats = pd.DataFrame({
+        "count": count.astype(int),
+        "mean": mean,
+        "std": np.sqrt(np.clip(variance, 0, None)),
+        "min": lowest,
+        "max": highest,
+    }, index=index)
+    return stats[present]
+
+def term_deltas(snapshot, by=("subject",), term=None, previous=None, workers=None):
+    """Change in mean score per group between two terms, largest drop first.
+
+    term defaults to the latest term in the snapshot and previous to the one
+    before it; terms order by name, which is chronological for current_term()
+    names such as "2025 Term 2". Groups need scores in both terms.
+    Returns (deltas DataFrame, term, previous).
+    """
+    by = tuple(by)
+    stats = group_stats(snapshot, by + ("term",), workers=workers)
+    terms = sorted(stats.index.get_level_values("term").unique())
+    if term is None and terms:
+        term = terms[-1]
+    if previous is None:
+        earlier = [name for name in terms if name < term] if term else []
+        previous = earlier[-1] if earlier else None
+
+    columns = ["previous_mean", "mean", "delta", "previous_count", "count"]
+    if term is None or previous is None:
+        return pd.DataFrame(columns=columns), term, previous
+
+    means = stats["mean"].unstack("term")
+    counts = stats["count"].unstack("term")
+    if term not in means or previous not in means:
+        return pd.DataFrame(columns=columns), term, previous
+    deltas = pd.DataFrame({
+        "previous_mean": means[previous],
+        "mean": means[term],
+        "delta": means[term] - means[previous],
+        "previous_count": counts[previous],
+        "count": counts[term],
+    }).dropna()
+    deltas[["previous_count", "count"]] = deltas[["previous_count", "count"]].astype(int)
+    return deltas.sort_values("delta"), term, previous
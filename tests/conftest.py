@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Always the SQLite backend; main opens its database on import
+os.environ.pop("REPORT_CARDS_DATABASE_URL", None)
+
+
+@pytest.fixture(scope="session")
+def main_module(tmp_path_factory):
+    os.chdir(tmp_path_factory.mktemp("import"))
+    import main
+
+    return main
+
+
+@pytest.fixture
+def main(main_module, tmp_path, monkeypatch):
+    """main, with a fresh SQLite database and empty Streamlit caches"""
+    import streamlit as st
+
+    monkeypatch.setattr(main_module, "DB_PATH", str(tmp_path / "report_cards.db"))
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    main_module.init_db()
+    yield main_module
+    st.cache_resource.clear()
+    st.cache_data.clear()
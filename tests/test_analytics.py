@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+
+
+def snapshot(rows):
+    snapshot = analytics.ReportSnapshot()
+    snapshot.frame = analytics.subject_frame(rows)
+    return snapshot
+
+
+ROWS = [
+    ("r1", "1A", "2025 Term 1", "Math", 60),
+    ("r1", "1A", "2025 Term 1", "English", 70),
+    ("r2", "1B", "2025 Term 1", "Math", 80),
+    ("r3", "1A", "2025 Term 2", "Math", 50),
+    ("r4", "1A", None, "Math", 99),
+]
+
+
+def test_group_stats_matches_pandas():
+    frame = pd.DataFrame(ROWS, columns=analytics.SNAPSHOT_COLUMNS)
+    stats = analytics.group_stats(snapshot(ROWS), by=("subject", "term"))
+    expected = frame.dropna().groupby(["subject", "term"])["score"].agg(
+        ["count", "mean", "std", "min", "max"]
+    )
+    assert list(stats.index) == list(expected.index)
+    assert stats["count"].tolist() == expected["count"].tolist()
+    assert np.allclose(stats["mean"], expected["mean"])
+    assert np.allclose(stats["min"], expected["min"])
+    assert np.allclose(stats["max"], expected["max"])
+    # Population standard deviation
+    assert np.allclose(stats.loc[("Math", "2025 Term 1"), "std"], 10.0)
+
+
+def test_group_stats_in_chunks_matches_one_pass():
+    rows = [(f"r{i}", f"1{'AB'[i % 2]}", "2025 Term 1", "Math", i % 101) for i in range(1000)]
+    whole = analytics.group_stats(snapshot(rows), by=("class_section",))
+    chunked = analytics.group_stats(snapshot(rows), by=("class_section",), chunk_size=64)
+    pd.testing.assert_frame_equal(whole, chunked)
+
+
+def test_group_stats_only_present_groups():
+    stats = analytics.group_stats(snapshot(ROWS), by=("class_section", "subject"))
+    assert list(stats.index) == [("1A", "English"), ("1A", "Math"), ("1B", "Math")]
+
+
+def test_group_stats_empty_snapshot():
+    stats = analytics.group_stats(analytics.ReportSnapshot(), by=("subject",))
+    assert stats.empty
+
+
+def test_group_stats_unknown_column():
+    with pytest.raises(ValueError):
+        analytics.group_stats(snapshot(ROWS), by=("student",))
+
+
+def test_term_deltas_latest_against_previous():
+    deltas, term, previous = analytics.term_deltas(snapshot(ROWS), by=("subject",))
+    assert (term, previous) == ("2025 Term 2", "2025 Term 1")
+    assert deltas.index.tolist() == ["Math"]
+    assert deltas.loc["Math", "delta"] == pytest.approx(50 - 70)
+
+
+def test_group_stats_on_worker_processes(monkeypatch):
+    rows = [(f"r{i}", "1A", "2025 Term 1", f"S{i % 3}", i % 101) for i in range(3000)]
+    in_process = analytics.group_stats(snapshot(rows), by=("subject",), workers=1)
+    monkeypatch.setattr(analytics, "PARALLEL_MIN_ROWS", 0)
+    pooled = analytics.group_stats(snapshot(rows), by=("subject",), workers=2, chunk_size=500)
+    pd.testing.assert_frame_equal(in_process, pooled)
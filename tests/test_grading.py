@@ -0,0 +1,22 @@
+def bands(*ranges):
+    return [(grade, low, high, "", "#FFFFFF") for grade, low, high in ranges]
+
+
+def test_default_bands_are_valid(main):
+    assert main.band_errors(main.load_active_scheme().bands) == []
+
+
+def test_band_errors_accepts_fractional_edges(main):
+    assert main.band_errors(bands(("P", 50, 100), ("F", 0, 49.5))) == []
+
+
+def test_band_errors_rejects_overlaps_and_gaps(main):
+    assert main.band_errors(bands(("A", 90, 100), ("B", 80, 95), ("F", 0, 79))) != []
+    assert main.band_errors(bands(("A", 90, 100), ("B", 80, 85), ("F", 0, 79))) != []
+
+
+def test_band_errors_rejects_bad_ranges(main):
+    assert main.band_errors(bands(("A", 90, 80), ("F", 0, 89))) != []
+    assert main.band_errors(bands(("A", 90, 99), ("F", 0, 89))) != []
+    assert main.band_errors(bands(("A", 90, 100), ("F", 10, 89))) != []
+    assert main.band_errors(bands(("A", 90, 100), ("F", 0, float("nan")))) != []
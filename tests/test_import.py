@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+
+def frame(*rows, columns=("student_name", "class_section", "subject", "score", "term")):
+    return pd.DataFrame(list(rows), columns=list(columns))
+
+
+def stored_reports(main):
+    with main.read_connection() as conn:
+        return pd.read_sql_query(
+            '''SELECT r.student_name, r.term, r.total_marks, s.subject_name, s.score
+               FROM reports r JOIN subjects s ON s.report_id = r.id
+               ORDER BY r.student_name, s.subject_name''',
+            conn,
+        )
+
+
+def test_grade_in_bulk_totals_averages_and_bands(main):
+    scheme = main.load_active_scheme()
+    totals, averages, bands = main.grade_in_bulk(
+        scheme, [0, 0, 1, 1], ["Math", "English", "Math", "English"], [95, 85, 40, 50], 2
+    )
+    assert totals.tolist() == [180, 90]
+    assert np.allclose(averages, [90.0, 45.0])
+    grades = [scheme.bands[band][0] for band in bands]
+    assert grades == [main.assign_grade(90, scheme)[0], main.assign_grade(45, scheme)[0]]
+
+
+def test_grade_in_bulk_report_without_subjects(main):
+    totals, averages, _ = main.grade_in_bulk(main.load_active_scheme(), [1], ["Math"], [70], 2)
+    assert totals.tolist() == [0, 70]
+    assert averages.tolist() == [0.0, 70.0]
+
+
+def test_import_inserts_then_is_idempotent(main):
+    rows = frame(
+        ("Ada", "1A", "Math", 90, "2025 Term 1"),
+        ("Ada", "1A", "English", 80, "2025 Term 1"),
+        ("Bob", "1A", "Math", 70, "2025 Term 1"),
+    )
+    assert main.import_reports(rows)["inserted"] == 2
+    stats = main.import_reports(rows)
+    assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (0, 0, 2)
+
+
+def test_import_updates_changed_scores(main):
+    main.import_reports(frame(("Ada", "1A", "Math", 90, "2025 Term 1")))
+    stats = main.import_reports(frame(("Ada", "1A", "Math", 60, "2025 Term 1")))
+    assert (stats["inserted"], stats["updated"]) == (0, 1)
+    assert stored_reports(main)["score"].tolist() == [60]
+
+
+def test_import_dry_run_writes_nothing(main):
+    stats = main.import_reports(frame(("Ada", "1A", "Math", 90, "2025 Term 1")), dry_run=True)
+    assert stats["inserted"] == 1
+    assert stored_reports(main).empty
+
+
+def test_import_keeps_last_row_of_a_repeated_subject(main):
+    rows = frame(
+        ("X", "1A", "Math", 90, "2025 Term 1"),
+        ("X", "1A", "Math", 80, "2025 Term 1"),
+    )
+    assert main.import_reports(rows)["inserted"] == 1
+    stored = stored_reports(main)
+    assert stored[["total_marks", "score"]].values.tolist() == [[80, 80]]
+    for dry_run in (True, False):
+        stats = main.import_reports(rows, dry_run=dry_run)
+        assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (0, 0, 1)
+
+
+def test_import_rejects_bad_scores(main):
+    rows = frame(
+        ("Ada", "1A", "Math", 101, "2025 Term 1"),
+        ("Ada", "1A", "English", "abc", "2025 Term 1"),
+        ("Ada", "1A", "Art", 75, "2025 Term 1"),
+    )
+    stats = main.import_reports(rows)
+    assert (stats["inserted"], stats["rejected"], stats["rejected_rows"]) == (1, 2, [0, 1])
+    assert stored_reports(main)["subject_name"].tolist() == ["Art"]
+
+
+def test_import_with_no_valid_rows(main):
+    empty = {"inserted": 0, "updated": 0, "unchanged": 0}
+    assert main.import_reports(frame()) == {**empty, "rejected": 0, "rejected_rows": []}
+    stats = main.import_reports(frame(("Ada", "1A", "Math", 101, "2025 Term 1")), dry_run=True)
+    assert stats == {**empty, "rejected": 1, "rejected_rows": [0]}
+
+
+def test_import_fills_missing_terms(main):
+    rows = frame(("Ada", "1A", "Math", 90, None), ("Bob", "1A", "Math", 70, ""))
+    main.import_reports(rows, term="2025 Term 2")
+    assert stored_reports(main)["term"].tolist() == ["2025 Term 2"] * 2
+    rows = frame(("Cy", "1A", "Math", 50), columns=("student_name", "class_section", "subject", "score"))
+    main.import_reports(rows)
+    assert stored_reports(main)["term"].tolist()[-1] == main.current_term()
@@ -0,0 +1,33 @@
+def record(main, report_id, date):
+    return main.ReportRecord(report_id, report_id, "1A", date, 0, 0.0, "F", "", "", "2025 Term 1")
+
+
+def ids(reports):
+    return [report.id for report in reports]
+
+
+def test_apply_report_changes_merges_by_date(main):
+    listed = [record(main, "c", "2025-03-03"), record(main, "a", "2025-01-01")]
+    changed = [record(main, "b", "2025-02-02"), record(main, "d", "2025-04-04")]
+    assert ids(main.apply_report_changes(listed, changed)) == ["d", "c", "b", "a"]
+
+
+def test_apply_report_changes_replaces_and_deletes(main):
+    listed = [record(main, "c", "2025-03-03"), record(main, "b", "2025-02-02"),
+              record(main, "a", "2025-01-01")]
+    moved = record(main, "a", "2025-05-05")
+    patched = main.apply_report_changes(listed, [moved], deleted=["b"])
+    assert ids(patched) == ["a", "c"]
+    assert patched[0] is moved
+
+
+def test_apply_report_changes_puts_changes_first_on_equal_dates(main):
+    listed = [record(main, "a", "2025-01-01")]
+    patched = main.apply_report_changes(listed, [record(main, "b", "2025-01-01")])
+    assert ids(patched) == ["b", "a"]
+
+
+def test_apply_report_changes_without_changes(main):
+    listed = [record(main, "a", "2025-01-01")]
+    assert main.apply_report_changes(listed, []) == listed
+    assert main.apply_report_changes(listed, [], deleted=["a"]) == []
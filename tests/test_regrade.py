@@ -0,0 +1,25 @@
+import pandas as pd
+
+
+def grades(main):
+    with main.read_connection() as conn:
+        rows = conn.execute('''SELECT term, grade FROM reports ORDER BY term''').fetchall()
+    return rows
+
+
+def test_regrade_only_the_given_term(main):
+    main.import_reports(pd.DataFrame({
+        "student_name": ["Ada", "Ada"],
+        "class_section": ["1A", "1A"],
+        "subject": ["Math", "Math"],
+        "score": [85, 85],
+        "term": ["2025 Term 1", "2025 Term 2"],
+    }))
+    active = main.load_active_scheme()
+    strict = main.GradingScheme(None, "Strict", active.bands, pass_mark=90)
+    failing = strict.bands[-1][0]
+
+    stats = main.regrade_reports(strict, term="2025 Term 2")
+    assert (stats["total"], stats["changed"]) == (1, 1)
+    assert grades(main) == [("2025 Term 1", main.assign_grade(85, active)[0]),
+                            ("2025 Term 2", failing)]